@@ -0,0 +1,337 @@
+"""
+Micro-benchmarks for the aoc_util hot paths
+
+Everything runs offline: grids and inputs are generated here and the
+html extraction uses the saved page in ./benchmarks/fixtures
+
+The aoc_util in ./src is always the one measured (not an installed copy)
+
+TO RUN from the main directory in terminal:
+    $ python benchmarks/run.py run --save benchmarks/results/baseline.json
+    $ python benchmarks/run.py run --save benchmarks/results/current.json
+    $ python benchmarks/run.py compare benchmarks/results/baseline.json \
+        benchmarks/results/current.json
+
+Each case is timed over --repeat rounds (rounds of all cases are interleaved
+so a slow moment on the machine is spread over every case) and the median,
+min, max and spread (scaled median absolute deviation) are saved along with
+every round. compare only flags a case when its median is slower by more
+than --threshold AND by more than NOISE_SIGMAS combined spreads, so two runs
+of the same tree should compare clean. On a quiet machine the spread is a
+few percent and --threshold decides, on a busy one the measured noise does.
+
+A case in the baseline but missing from the current results fails the
+compare, unless --allow-missing is passed (e.g. after run --only grid)
+"""
+
+import json
+import platform
+import random
+import statistics
+import string
+import sys
+import tempfile
+from argparse import ArgumentParser
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+from rich.console import Console
+
+# benchmark the working tree, not whatever aoc_util is installed
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+from aoc_util.files import extract_code_blocks, longest_code_snippet  # noqa: E402
+from aoc_util.grid import Grid, Point  # noqa: E402
+from aoc_util.helper import chunks, read  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# (name, value) pairs, each hot path is measured at every size
+GRID_SIZES = [("small", 10), ("medium", 50), ("large", 200)]
+TEXT_SIZES = [("small", 1_000), ("medium", 50_000), ("large", 1_000_000)]
+LIST_SIZES = [("small", 100), ("medium", 10_000), ("large", 1_000_000)]
+HTML_SIZES = [("small", 1), ("medium", 10), ("large", 50)]
+
+# minimum time for one timing round, loops are added until we get there
+MIN_ROUND_NS = 20_000_000
+# a slowdown also has to be bigger than this many (combined) spreads to count
+NOISE_SIGMAS = 3
+
+# soft_wrap keeps every result on one line when output isn't a terminal
+console = Console(soft_wrap=True)
+
+
+def make_grid_rows(size: int, seed: int = 2021) -> list[str]:
+    """square grid of '.' and '#' characters, seeded so runs are comparable"""
+    rng = random.Random(seed)  # noqa: S311
+    return ["".join(rng.choice(".#") for _ in range(size)) for _ in range(size)]
+
+
+def make_text(n_chars: int, seed: int = 2021) -> str:
+    """puzzle-input-like text, lines of digits and letters"""
+    rng = random.Random(seed)  # noqa: S311
+    alphabet = string.ascii_lowercase + string.digits
+    lines = []
+    total = 0
+    while total < n_chars:
+        line = "".join(rng.choice(alphabet) for _ in range(79))
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)[:n_chars]
+
+
+def make_html(repeat: int) -> str:
+    """fixture puzzle page with the article repeated to grow the page"""
+    page = (FIXTURES / "puzzle.html").read_text()
+    start = page.index("<article")
+    end = page.index("</article>") + len("</article>")
+    return page[:start] + page[start:end] * repeat + page[end:]
+
+
+def build_cases(tmp_dir: Path) -> dict[str, Callable[[], Any]]:
+    """
+    Builds every benchmark case
+    Returns a dictionary of case name -> zero argument callable
+    """
+    cases = {}
+
+    for label, size in GRID_SIZES:
+        grid = Grid(make_grid_rows(size))
+        positions = [(x, y) for y in range(size) for x in range(size)]
+        points = [Point(x, y) for x, y in positions]
+
+        def grid_get_tuple(grid=grid, positions=positions):
+            return [grid.get(p) for p in positions]
+
+        def grid_get_point(grid=grid, points=points):
+            return [grid.get(p) for p in points]
+
+        def scan_surroundings(grid=grid, positions=positions):
+            return [grid.scan_surroundings(p) for p in positions]
+
+        def search_grid(grid=grid):
+            return list(grid.search_grid(lambda v: v == "#"))
+
+        cases[f"grid.get-tuple-{label}"] = grid_get_tuple
+        cases[f"grid.get-point-{label}"] = grid_get_point
+        cases[f"grid.scan_surroundings-{label}"] = scan_surroundings
+        cases[f"grid.search_grid-{label}"] = search_grid
+
+    for label, size in TEXT_SIZES:
+        path = tmp_dir / f"input-{label}.txt"
+        path.write_text(make_text(size))
+
+        def read_input(path=str(path)):
+            return read(path)
+
+        cases[f"helper.read-{label}"] = read_input
+
+    for label, size in LIST_SIZES:
+        data = list(range(size))
+
+        def chunk_list(data=data):
+            return chunks(data, 5)
+
+        cases[f"helper.chunks-{label}"] = chunk_list
+
+    for label, repeat in HTML_SIZES:
+        html = make_html(repeat)
+
+        def extract_example(html=html):
+            return longest_code_snippet(extract_code_blocks(html))
+
+        cases[f"files.extract_code_blocks-{label}"] = extract_example
+
+    return cases
+
+
+def calibrate(func: Callable[[], Any]) -> int:
+    """
+    Finds how many loops of a zero argument callable make one round
+    Loops are doubled until one round takes at least MIN_ROUND_NS
+    """
+    func()  # warm up
+    loops = 1
+    while time_round(func, loops) * loops < MIN_ROUND_NS:
+        loops *= 2
+    return loops
+
+
+def time_round(func: Callable[[], Any], loops: int) -> float:
+    """returns the ns per call of one round of loops"""
+    start = perf_counter_ns()
+    for _ in range(loops):
+        func()
+    return (perf_counter_ns() - start) / loops
+
+
+def summarize(times: list[float]) -> dict:
+    """
+    median, min, max and spread (ns per call) of the rounds of one case
+    spread is the median absolute deviation scaled to match a stdev,
+    so one slow round (gc, another process) doesn't blow it up
+    """
+    median = statistics.median(times)
+    return {
+        "median": median,
+        "min": min(times),
+        "max": max(times),
+        "spread": 1.4826 * statistics.median([abs(t - median) for t in times]),
+        "times": times,
+    }
+
+
+def run(save: str | None, repeat: int, only: str | None) -> dict:
+    """runs the benchmarks, optionally saving the results as json"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = {
+            name: func
+            for name, func in build_cases(Path(tmp)).items()
+            if only is None or only in name
+        }
+        loops = {name: calibrate(func) for name, func in cases.items()}
+        times = {name: [] for name in cases}
+        # interleave the rounds so machine noise is shared by every case
+        for _ in range(repeat):
+            for name, func in cases.items():
+                times[name].append(time_round(func, loops[name]))
+
+    results = {name: summarize(t) for name, t in times.items()}
+    for name, r in results.items():
+        console.print(
+            f"[yellow]{r['median']:14.0f} ns[/yellow] "
+            f"± {r['spread'] / r['median']:6.1%} | [bold]{name}[/bold]"
+        )
+
+    output = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "results": results,
+    }
+    if save is not None:
+        p = Path(save)
+        if not p.parent.exists():
+            p.parent.mkdir(parents=True)
+        p.write_text(json.dumps(output, indent=2))
+        console.print(f"[green]-> RESULTS SAVED: {p}\n")
+    return output
+
+
+def compare(
+    baseline: str, current: str, threshold: float, allow_missing: bool = False
+) -> bool:
+    """
+    Compares two saved result files
+    Returns False if any case's median is slower than baseline * (1 + threshold)
+    and by more than NOISE_SIGMAS combined spreads (so noise isn't a regression)
+    or if a baseline case is missing from current (unless allow_missing)
+    Warns if the results came from a different python or machine
+    """
+    base_output = json.loads(Path(baseline).read_text())
+    curr_output = json.loads(Path(current).read_text())
+    base = base_output["results"]
+    curr = curr_output["results"]
+
+    for key in ["python", "machine"]:
+        if base_output.get(key) != curr_output.get(key):
+            console.print(
+                f"[red]-> WARNING: {key.upper()} DIFFERS. "
+                f"BASELINE: {base_output.get(key)} CURRENT: {curr_output.get(key)}"
+            )
+
+    ok = True
+    for name in sorted(base.keys() | curr.keys()):
+        if name not in base:
+            console.print(f"[blue]   NEW CASE, NOT IN BASELINE[/blue] | {name}")
+            continue
+        if name not in curr:
+            if allow_missing:
+                console.print(f"[blue]   MISSING FROM CURRENT[/blue] | {name}")
+            else:
+                ok = False
+                console.print(f"[red]   MISSING FROM CURRENT[/red] | {name}")
+            continue
+        b, c = base[name], curr[name]
+        change = c["median"] / b["median"] - 1
+        spread = (b["spread"] ** 2 + c["spread"] ** 2) ** 0.5
+        noise = NOISE_SIGMAS * spread / b["median"]
+        if change > threshold and change > noise:
+            ok = False
+            colour = "red"
+        elif change < -threshold and -change > noise:
+            colour = "green"
+        else:
+            colour = "white"
+        console.print(
+            f"[{colour}]{change:+8.1%}[/{colour}] (noise ±{noise:5.1%}) | "
+            f"{b['median']:14.0f} ns -> {c['median']:14.0f} ns | [bold]{name}[/bold]"
+        )
+
+    if ok:
+        console.print(f"\n[green]-> NO REGRESSIONS OVER {threshold:.0%} AND THE NOISE")
+    else:
+        console.print(
+            f"\n[red]-> REGRESSION OVER {threshold:.0%} AND THE NOISE, OR MISSING CASE"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the aoc_util hot paths.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument(
+        "-s",
+        "--save",
+        default=None,
+        type=str,
+        help="Path of a .json file to save the results to.",
+    )
+    run_parser.add_argument(
+        "-r",
+        "--repeat",
+        default=15,
+        type=int,
+        help="Number of timing rounds per case, the median is compared.",
+    )
+    run_parser.add_argument(
+        "-k",
+        "--only",
+        default=None,
+        type=str,
+        help="Only run cases whose name contains this string.",
+    )
+
+    compare_parser = sub.add_parser(
+        "compare", help="Fail if any case regressed past the threshold."
+    )
+    compare_parser.add_argument("baseline", type=str, help="Baseline results .json")
+    compare_parser.add_argument("current", type=str, help="Current results .json")
+    compare_parser.add_argument(
+        "-t",
+        "--threshold",
+        default=0.10,
+        type=float,
+        help="Allowed slowdown as a fraction (0.10 = 10%%), "
+        "cases noisier than this use their measured noise instead.",
+    )
+    compare_parser.add_argument(
+        "-m",
+        "--allow-missing",
+        action="store_true",
+        help="Don't fail on baseline cases missing from current (run --only).",
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        run(args.save, args.repeat, args.only)
+    elif not compare(args.baseline, args.current, args.threshold, args.allow_missing):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,28 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+AOC_URL = "https://adventofcode.com"
+HEADERS = {"User-agent": "github.com/jaceiverson/aoc-util by iverson.jace@gmail.com"}
 
-def get_aoc_page(url: str) -> requests.Response:
+
+def get_aoc_session() -> requests.Session:
+    """
+    Creates a requests Session with the COOKIE_SESSION enviornment variable
+    and standardized User-Agent already set. Reusing a session keeps the
+    connection (and TLS handshake) alive between requests
+
+    Returns:
+        requests.Session: session ready to use with get_aoc_page
+    """
+    session = requests.Session()
+    session.cookies.set("session", os.environ["COOKIE_SESSION"])
+    session.headers.update(HEADERS)
+    return session
+
+
+def get_aoc_page(
+    url: str, session: requests.Session | None = None
+) -> requests.Response:
     """
     Makes HTTP requests to the advent of code website
     Pulls in the COOKIE_SESSION enviornment variable
@@ -14,15 +34,17 @@ def get_aoc_page(url: str) -> requests.Response:
 
     Args:
         url (str): url that we will pull
+        session (requests.Session, optional): session from get_aoc_session,
+            will make a one off request if not given
 
     Returns:
         requests.Response: object response
     """
+    if session is not None:
+        return session.get(url=url, timeout=120)
     return requests.get(
         url=url,
         cookies={"session": os.environ["COOKIE_SESSION"]},
-        headers={
-            "User-agent": "github.com/jaceiverson/aoc-util by iverson.jace@gmail.com"
-        },
+        headers=HEADERS,
         timeout=120,
     )
@@ -1,32 +1,89 @@
 import datetime as dt
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import pytz
 from bs4 import BeautifulSoup
+from requests import Session
+from requests.exceptions import RequestException
 from requests.models import HTTPError
 from rich import print
 
-from aoc_util.aoc_requests import get_aoc_page
+from aoc_util.aoc_requests import AOC_URL, get_aoc_page, get_aoc_session
 from aoc_util.helper import check_paths_create_files, write
 
 # EASTERN TIME FOR EVERYTHING
 EASTERN = pytz.timezone("US/Eastern")
 
+# how long before unlock we open (and TLS handshake) the connections
+WARM_UP_SECONDS = 10
+# the last stretch before unlock is slept in small steps to wake on time
+FINE_SLEEP_SECONDS = 1
+FINE_SLEEP_STEP = 0.005
+# longest single sleep, so a suspended machine re-checks the clock on waking
+MAX_SLEEP_SECONDS = 60
+# retries if the input isn't served yet right at unlock
+UNLOCK_RETRIES = 5
+UNLOCK_RETRY_DELAY = 0.25
+
+# all the waiting in this module sleeps through here, so tests can swap it
+# out without touching time.sleep for the whole process
+_sleep = time.sleep
+
+
+def eastern_now() -> dt.datetime:
+    """
+    returns the current time in eastern time
+    (all the waiting goes through here so it can be patched in tests)
+    """
+    return dt.datetime.now(EASTERN)
+
+
+def aoc_unlock_time(day: int, year: int) -> dt.datetime:
+    """
+    returns the time the puzzle unlocks (midnight eastern)
+    """
+    return EASTERN.localize(dt.datetime(year, 12, day))
+
 
 def is_aoc_input_ready(day: int, year: int) -> bool:
     """
     checks to see if the input is ready to be pulled
     """
-    return EASTERN.localize(dt.datetime(year, 12, day)) <= dt.datetime.now(EASTERN)
+    return aoc_unlock_time(day, year) <= eastern_now()
+
+
+def sleep_until(when: dt.datetime) -> None:
+    """
+    sleeps until the given (timezone aware) time
+    Sleeps in chunks of at most MAX_SLEEP_SECONDS (checking the wall clock
+    between them), then in small steps for the last FINE_SLEEP_SECONDS
+    so we don't oversleep the target
+    """
+    while True:
+        remaining = (when - eastern_now()).total_seconds()
+        if remaining <= 0:
+            return
+        if remaining > FINE_SLEEP_SECONDS:
+            _sleep(min(remaining - FINE_SLEEP_SECONDS, MAX_SLEEP_SECONDS))
+        else:
+            _sleep(min(remaining, FINE_SLEEP_STEP))
 
 
-def get_all_code_formated_html(url: str) -> list:
+def get_all_code_formated_html(url: str, session: Session | None = None) -> list:
     """
     Will return a list of all the code blocks on the page
     """
-    r = get_aoc_page(url)
+    r = get_aoc_page(url, session)
+    return extract_code_blocks(r.text)
 
-    soup = BeautifulSoup(r.text, "html.parser")
+
+def extract_code_blocks(html: str) -> list:
+    """
+    Will return a list of the text of every code block in an html page
+    """
+    soup = BeautifulSoup(html, "html.parser")
     code_elements = soup.find_all("code")
 
     return [code.text for code in code_elements]
@@ -39,18 +96,18 @@ def longest_code_snippet(code: list) -> str:
     return max(code, key=len)
 
 
-def pull_example_input(url: str):
-    code = get_all_code_formated_html(url)
+def pull_example_input(url: str, session: Session | None = None):
+    code = get_all_code_formated_html(url, session)
     if code:
         return longest_code_snippet(code)
     print()
 
 
-def get_main_input(url: str):
+def get_main_input(url: str, session: Session | None = None):
     """
     gets main input for url
     """
-    r = get_aoc_page(url)
+    r = get_aoc_page(url, session)
     if not r.ok:
         raise HTTPError(
             f"Did not get status 200. STATUS: {r.status_code}, "
@@ -82,7 +139,7 @@ def create_input_file(day: int, year: int) -> None:
         if check_paths_create_files(file_path):
             # if the file didn't exist (this function creates it),
             # get the input and save to to the file
-            r = get_main_input(f"https://adventofcode.com/{year}/day/{day}/input")
+            r = get_main_input(f"{AOC_URL}/{year}/day/{day}/input")
             with open(file_path, "w") as f:
                 f.write(r.text)
             print(f"[green]-> INPUT FILE SAVED: {file_path}\n")
@@ -92,6 +149,132 @@ def create_input_file(day: int, year: int) -> None:
         print(f"[red]-> INPUT IS NOT READY FOR YEAR: {year} DAY: {day}\n")
 
 
+def get_unlocked_page(url: str, session: Session | None = None):
+    """
+    gets a page that should have just unlocked
+    AOC answers 404 until the puzzle is live, so retries a few times
+    in case our clock is slightly ahead of theirs
+    """
+    for attempt in range(UNLOCK_RETRIES):
+        if attempt:
+            _sleep(UNLOCK_RETRY_DELAY)
+        r = get_aoc_page(url, session)
+        if r.status_code != 404:
+            break
+    if r.status_code == 404:
+        raise HTTPError(
+            f"Still 404 after {UNLOCK_RETRIES} tries, "
+            "the puzzle is not unlocked yet (is your clock ahead?)"
+        )
+    if not r.ok:
+        raise HTTPError(
+            f"Did not get status 200. STATUS: {r.status_code}, "
+            "verify session cookie is correct"
+        )
+    return r
+
+
+def pull_unlocked_example_input(url: str, session: Session | None = None):
+    """
+    same as pull_example_input, but retries while the page isn't unlocked
+    returns None if the page has no code blocks
+    """
+    code = extract_code_blocks(get_unlocked_page(url, session).text)
+    if code:
+        return longest_code_snippet(code)
+    return None
+
+
+def warm_up_session(session: Session, connections: int = 1) -> None:
+    """
+    opens the connections (and does the TLS handshake) ahead of time
+    so the requests at unlock can reuse them
+    """
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        try:
+            list(
+                pool.map(
+                    lambda _: session.head(f"{AOC_URL}/", timeout=120),
+                    range(connections),
+                )
+            )
+        except RequestException as e:
+            print(f"[red]-> COULD NOT WARM UP CONNECTION: {e}")
+
+
+def wait_and_create_input_files(
+    day: int, year: int, save_example_input: bool = False
+) -> None:
+    """
+    Waits for the puzzle to unlock (midnight eastern) then pulls the input
+    (and the example input if save_example_input) as fast as possible
+
+    WARM_UP_SECONDS before unlock the connections are opened so the
+    TLS handshake is already done, then right at unlock the input and
+    the puzzle page are pulled at the same time.
+
+    Each file is saved as soon as its own request finishes, if one of them
+    fails the other is still saved. Reports the time from unlock (if we
+    waited for it) and from starting the requests to each file being saved
+    """
+    input_path = Path(f"./{year}/inputs/{day}.txt")
+    example_path = Path(f"./{year}/inputs/{day}-test-e.txt")
+    url = f"{AOC_URL}/{year}/day/{day}"
+
+    jobs = {}
+    print(f"-> CREATING INPUT FILE: [yellow]{input_path}")
+    if input_path.exists():
+        print("[blue]-> FILE EXISTS. Will not overwrite\n")
+    else:
+        jobs[input_path] = lambda s: get_unlocked_page(f"{url}/input", s).text
+    if save_example_input:
+        print(f"-> CREATING TEST INPUT FILE FROM EXAMPLE INPUT: [yellow]{example_path}")
+        if example_path.exists():
+            print("[blue]-> FILE EXISTS. Will not overwrite.\n")
+        else:
+            jobs[example_path] = lambda s: pull_unlocked_example_input(url, s)
+    if not jobs:
+        return
+
+    session = get_aoc_session()
+    unlock = aoc_unlock_time(day, year)
+    waited = not is_aoc_input_ready(day, year)
+    if waited:
+        print(
+            f"-> WAITING FOR UNLOCK: [yellow]{unlock:%Y-%m-%d %H:%M:%S %Z}[/yellow] "
+            f"(in {str(unlock - eastern_now()).split('.')[0]})"
+        )
+        sleep_until(unlock - dt.timedelta(seconds=WARM_UP_SECONDS))
+        warm_up_session(session, len(jobs))
+        sleep_until(unlock)
+        print("[green]-> PUZZLE UNLOCKED")
+
+    start = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {pool.submit(fetch, session): path for path, fetch in jobs.items()}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                text = future.result()
+            except Exception as e:
+                print(f"[red]-> COULD NOT CREATE {path}: {e!r}")
+                continue
+            if text is None:
+                print(f"[red]-> NO EXAMPLE INPUT FOUND FOR: {path}")
+                continue
+            write(str(path), text)
+            request_ms = (time.perf_counter_ns() - start) / 1e6
+            if waited:
+                unlock_ms = (eastern_now() - unlock).total_seconds() * 1e3
+                timing = (
+                    f"{unlock_ms:.0f} ms after unlock ({request_ms:.0f} ms request)"
+                )
+            else:
+                timing = f"{request_ms:.0f} ms"
+            print(f"[green]-> FILE SAVED: {path} | TIME TO FILE: {timing}")
+    print()
+
+
 def create_test_input_file(day: int, year: int, suffix: str = None) -> None:
     """
     Creates a test input file for the given day and year
@@ -114,9 +297,7 @@ def create_test_input_file_from_example(year: int, day: int):
     print(f"-> CREATING TEST INPUT FILE FROM EXAMPLE INPUT: [yellow]{file_path}")
     if is_aoc_input_ready(day, year):
         if check_paths_create_files(Path(file_path)):
-            input_example = pull_example_input(
-                f"https://adventofcode.com/{year}/day/{day}"
-            )
+            input_example = pull_example_input(f"{AOC_URL}/{year}/day/{day}")
             write(file_path, input_example)
             print(f"[green]-> TEST INPUT FILE CREATED FROM EXAMPLE: {file_path}\n")
         else:
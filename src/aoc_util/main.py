@@ -11,11 +11,31 @@ from aoc_util.files import (
     create_python_file,
     create_test_input_file,
     create_test_input_file_from_example,
+    eastern_now,
+    wait_and_create_input_files,
 )
 
 # EASTERN TIME FOR EVERYTHING
 EASTERN = pytz.timezone("US/Eastern")
 
+# with --wait, running within this long before an unlock defaults to that day
+WAIT_LOOKAHEAD = dt.timedelta(hours=1)
+
+
+def default_date(wait: bool = False, now: dt.datetime | None = None) -> dt.datetime:
+    """
+    returns the date the default day and year are taken from
+    Normally that is now (eastern), but when waiting for midnight we
+    want tomorrow's puzzle, not today's (only if tomorrow has one, Dec 1-25)
+    """
+    if now is None:
+        now = eastern_now()
+    if wait:
+        ahead = now + WAIT_LOOKAHEAD
+        if ahead.month == 12 and ahead.day <= 25:
+            return ahead
+    return now
+
 
 def newday() -> None:
     print("[yellow]--- PROCESS STARTING ---\n")
@@ -57,36 +77,48 @@ def newday() -> None:
         action="store_true",
         help="Scrape the day for the example input, save to {day}-test-e.txt file.",
     )
+    parser.add_argument(
+        "-w",
+        "--wait",
+        action="store_true",
+        help="Waits for the day to unlock (midnight EST) then pulls the input "
+        "(and the example input with -s) right away. Implies -i.",
+    )
     args = parser.parse_args()
 
-    if args.day is None and args.year is None and dt.datetime.now(EASTERN).month != 12:
+    now = default_date(args.wait)
+
+    if args.day is None and args.year is None and now.month != 12:
         raise ValueError("Sorry. Default values are only available in December.")
 
     # if we are here that means we have some values,
     # but we may need to check and default some of our
     # values if they were omitted
     if args.day is None:
-        args.day = dt.datetime.now(EASTERN).day
+        args.day = now.day
     if args.year is None:
-        args.year = dt.datetime.now(EASTERN).year
+        args.year = now.year
 
     # now we can check the values to make sure they are in range
     # day between 1 and 25
     # year between 2015 and whatever the current year is
     if args.day not in range(1, 26):
         raise ValueError("Day needs to be in range (1-25)")
-    if args.year not in range(2015, dt.datetime.now(EASTERN).year + 1):
-        raise ValueError(
-            f"Year needs to be in range {range(2015,dt.datetime.now(EASTERN).year+1)}"
-        )
+    if args.year not in range(2015, now.year + 1):
+        raise ValueError(f"Year needs to be in range {range(2015, now.year + 1)}")
 
     # we will always attempt to create the python file here
     create_python_file(args.day, args.year)
 
     """CONDITIONAL CREATIONS"""
 
+    # Wait for the unlock, then create Input File (prod)
+    # and the Test Input File from Example at the same time
+    if args.wait:
+        wait_and_create_input_files(args.day, args.year, args.save_example_input)
+
     # Create Input File (prod)
-    if args.input:
+    elif args.input:
         create_input_file(args.day, args.year)
 
     # Create a Test Input File (testing)
@@ -94,7 +126,7 @@ def newday() -> None:
         create_test_input_file(args.day, args.year, args.test_input)
 
     # Create a Test Input File from Example in Problem
-    if args.save_example_input:
+    if args.save_example_input and not args.wait:
         create_test_input_file_from_example(args.year, args.day)
 
     print("[yellow]--- PROCESS COMPLETE ---")
@@ -7,14 +7,14 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from rich import print
 
-from aoc_util.aoc_requests import get_aoc_page
+from aoc_util.aoc_requests import AOC_URL, get_aoc_page
 
 
 def get_aoc_stars() -> str:
     """Scrapes the AOC Page retrives star information to display in README"""
 
     # Send the URL Request with Cookie to get HTML
-    response = get_aoc_page(f"https://adventofcode.com/{date.today().year-1}/events")
+    response = get_aoc_page(f"{AOC_URL}/{date.today().year-1}/events")
     soup = BeautifulSoup(response.text, "html.parser")
     # Total Stars
     total_stars = soup.find(string="Total stars: ")
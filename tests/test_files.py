@@ -0,0 +1,246 @@
+"""tests for the --wait flow in files.py, against a local mock AOC server"""
+
+import datetime as dt
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from requests.models import HTTPError
+
+from aoc_util import files
+
+# the tests' own copy, so editing the benchmark fixture can't change EXAMPLE
+PUZZLE_PAGE = (Path(__file__).parent / "fixtures" / "puzzle.html").read_text()
+EXAMPLE = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+INPUT = "1 2\n3 4\n"
+
+
+class MockAOC:
+    """
+    local stand in for adventofcode.com
+    routes maps a path to a function returning (status, body)
+    every request is recorded, along with the most requests in flight at once
+    """
+
+    def __init__(self) -> None:
+        self.routes = {}
+        self.delay = 0.0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_HEAD(self) -> None:
+                mock.requests.append(("HEAD", self.path, files.eastern_now()))
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self) -> None:
+                mock.requests.append(("GET", self.path, files.eastern_now()))
+                with mock.lock:
+                    mock.in_flight += 1
+                    mock.max_in_flight = max(mock.max_in_flight, mock.in_flight)
+                time.sleep(mock.delay)
+                route = mock.routes.get(self.path, lambda: (404, "Not Found"))
+                status, body = route()
+                with mock.lock:
+                    mock.in_flight -= 1
+                data = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def gets(self, path: str) -> int:
+        return len([r for r in self.requests if r[0] == "GET" and r[1] == path])
+
+
+@pytest.fixture
+def aoc(monkeypatch, tmp_path):
+    mock = MockAOC()
+    thread = threading.Thread(target=mock.server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(files, "AOC_URL", mock.url)
+    monkeypatch.setattr(files, "UNLOCK_RETRY_DELAY", 0.01)
+    monkeypatch.setenv("COOKIE_SESSION", "test-session")
+    monkeypatch.chdir(tmp_path)
+    yield mock
+    mock.server.shutdown()
+    mock.server.server_close()
+
+
+def freeze_clock(monkeypatch, start: dt.datetime) -> list[float]:
+    """
+    replaces the clock with a fake one starting at start
+    files._sleep moves the fake clock forward instead of sleeping
+    returns the list of sleeps so tests can look at them
+    """
+    clock = {"now": start}
+    sleeps = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += dt.timedelta(seconds=seconds)
+
+    monkeypatch.setattr(files, "eastern_now", lambda: clock["now"])
+    monkeypatch.setattr(files, "_sleep", fake_sleep)
+    return sleeps
+
+
+def shift_clock(monkeypatch, to: dt.datetime) -> None:
+    """moves the real clock so it is now `to`, time still passes normally"""
+    offset = to - dt.datetime.now(files.EASTERN)
+    monkeypatch.setattr(
+        files, "eastern_now", lambda: dt.datetime.now(files.EASTERN) + offset
+    )
+
+
+def test_sleep_until_wakes_on_time(monkeypatch):
+    unlock = files.aoc_unlock_time(5, 2024)
+    sleeps = freeze_clock(monkeypatch, unlock - dt.timedelta(hours=3))
+
+    files.sleep_until(unlock)
+
+    woke = files.eastern_now()
+    assert unlock <= woke < unlock + dt.timedelta(seconds=files.FINE_SLEEP_STEP)
+    # the wall clock is checked at least every MAX_SLEEP_SECONDS
+    assert max(sleeps) <= files.MAX_SLEEP_SECONDS
+    # only files is frozen, time.sleep is still real for everything else
+    assert time.sleep is not files._sleep
+
+
+def test_sleep_until_catches_up_after_suspend(monkeypatch):
+    unlock = files.aoc_unlock_time(5, 2024)
+    sleeps = freeze_clock(monkeypatch, unlock - dt.timedelta(hours=3))
+    fake_sleep = files._sleep
+
+    def suspended_sleep(seconds: float) -> None:
+        # the first sleep is suspended for 2 hours on top of what was asked
+        if not sleeps:
+            fake_sleep(2 * 60 * 60)
+        fake_sleep(seconds)
+
+    monkeypatch.setattr(files, "_sleep", suspended_sleep)
+
+    files.sleep_until(unlock)
+
+    woke = files.eastern_now()
+    assert unlock <= woke < unlock + dt.timedelta(seconds=files.FINE_SLEEP_STEP)
+
+
+def test_sleep_until_real_clock():
+    target = files.eastern_now() + dt.timedelta(seconds=0.2)
+
+    files.sleep_until(target)
+
+    late = (files.eastern_now() - target).total_seconds()
+    assert 0 <= late < 0.05
+
+
+def test_get_unlocked_page_retries_404(aoc):
+    responses = iter([(404, "Not Found"), (404, "Not Found"), (200, INPUT)])
+    aoc.routes["/2024/day/5/input"] = lambda: next(responses)
+
+    r = files.get_unlocked_page(f"{aoc.url}/2024/day/5/input")
+
+    assert r.text == INPUT
+    assert aoc.gets("/2024/day/5/input") == 3
+
+
+def test_get_unlocked_page_gives_up(aoc):
+    with pytest.raises(HTTPError, match="not unlocked yet"):
+        files.get_unlocked_page(f"{aoc.url}/2024/day/5/input")
+
+    assert aoc.gets("/2024/day/5/input") == files.UNLOCK_RETRIES
+
+
+def test_get_unlocked_page_bad_cookie(aoc):
+    aoc.routes["/2024/day/5/input"] = lambda: (400, "Bad Request")
+
+    with pytest.raises(HTTPError, match="session cookie"):
+        files.get_unlocked_page(f"{aoc.url}/2024/day/5/input")
+
+    assert aoc.gets("/2024/day/5/input") == 1
+
+
+def test_wait_writes_both_files_concurrently(aoc):
+    aoc.delay = 0.3
+    aoc.routes["/2020/day/1/input"] = lambda: (200, INPUT)
+    aoc.routes["/2020/day/1"] = lambda: (200, PUZZLE_PAGE)
+
+    start = time.perf_counter()
+    files.wait_and_create_input_files(1, 2020, save_example_input=True)
+    elapsed = time.perf_counter() - start
+
+    assert Path("2020/inputs/1.txt").read_text() == INPUT
+    assert Path("2020/inputs/1-test-e.txt").read_text() == EXAMPLE
+    assert aoc.max_in_flight == 2
+    assert elapsed < 2 * aoc.delay
+
+
+def test_wait_sleeps_until_unlock(aoc, monkeypatch):
+    unlock = files.aoc_unlock_time(5, 2024)
+    shift_clock(monkeypatch, unlock - dt.timedelta(seconds=0.6))
+    monkeypatch.setattr(files, "WARM_UP_SECONDS", 0.3)
+
+    def live(body: str):
+        return lambda: (200, body) if files.eastern_now() >= unlock else (404, "")
+
+    aoc.routes["/2024/day/5/input"] = live(INPUT)
+    aoc.routes["/2024/day/5"] = live(PUZZLE_PAGE)
+
+    files.wait_and_create_input_files(5, 2024, save_example_input=True)
+
+    assert Path("2024/inputs/5.txt").read_text() == INPUT
+    assert Path("2024/inputs/5-test-e.txt").read_text() == EXAMPLE
+    # connections are warmed up before unlock, puzzle is pulled after it
+    heads = [r for r in aoc.requests if r[0] == "HEAD"]
+    gets = [r for r in aoc.requests if r[0] == "GET"]
+    assert len(heads) == 2
+    assert all(r[2] < unlock for r in heads)
+    assert all(r[2] >= unlock for r in gets)
+    assert len(gets) == 2
+
+
+def test_wait_example_without_code_still_saves_input(aoc):
+    aoc.routes["/2020/day/1/input"] = lambda: (time.sleep(0.2), (200, INPUT))[1]
+    aoc.routes["/2020/day/1"] = lambda: (200, "<html><p>no code here</p></html>")
+
+    files.wait_and_create_input_files(1, 2020, save_example_input=True)
+
+    assert Path("2020/inputs/1.txt").read_text() == INPUT
+    assert not Path("2020/inputs/1-test-e.txt").exists()
+
+
+def test_wait_example_error_still_saves_input(aoc):
+    aoc.routes["/2020/day/1/input"] = lambda: (time.sleep(0.2), (200, INPUT))[1]
+    aoc.routes["/2020/day/1"] = lambda: (500, "Internal Server Error")
+
+    files.wait_and_create_input_files(1, 2020, save_example_input=True)
+
+    assert Path("2020/inputs/1.txt").read_text() == INPUT
+    assert not Path("2020/inputs/1-test-e.txt").exists()
+
+
+def test_wait_input_error_still_saves_example(aoc):
+    aoc.routes["/2020/day/1/input"] = lambda: (400, "Bad Request")
+    aoc.routes["/2020/day/1"] = lambda: (200, PUZZLE_PAGE)
+
+    files.wait_and_create_input_files(1, 2020, save_example_input=True)
+
+    assert not Path("2020/inputs/1.txt").exists()
+    assert Path("2020/inputs/1-test-e.txt").read_text() == EXAMPLE
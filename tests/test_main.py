@@ -0,0 +1,78 @@
+"""tests for picking the default day and year in main.py"""
+
+import datetime as dt
+import sys
+
+import pytest
+
+from aoc_util import main
+from aoc_util.files import EASTERN
+
+
+def eastern(year: int, month: int, day: int, hour: int, minute: int) -> dt.datetime:
+    return EASTERN.localize(dt.datetime(year, month, day, hour, minute))
+
+
+@pytest.mark.parametrize(
+    "now, expected",
+    [
+        # the hour before an unlock defaults to the puzzle about to unlock
+        (eastern(2024, 11, 30, 23, 30), (2024, 12, 1)),
+        (eastern(2024, 12, 5, 23, 30), (2024, 12, 6)),
+        (eastern(2024, 12, 24, 23, 30), (2024, 12, 25)),
+        # no puzzle tomorrow, keep the normal defaults
+        (eastern(2024, 12, 25, 23, 30), (2024, 12, 25)),
+        (eastern(2024, 12, 31, 23, 30), (2024, 12, 31)),
+        # not close to midnight
+        (eastern(2024, 12, 5, 12, 0), (2024, 12, 5)),
+    ],
+)
+def test_default_date_wait(now, expected):
+    date = main.default_date(wait=True, now=now)
+
+    assert (date.year, date.month, date.day) == expected
+
+
+def test_default_date_no_wait_ignores_lookahead():
+    date = main.default_date(now=eastern(2024, 12, 5, 23, 30))
+
+    assert (date.year, date.month, date.day) == (2024, 12, 5)
+
+
+@pytest.fixture
+def newday(monkeypatch, tmp_path):
+    """
+    runs newday with the given args and frozen clock,
+    returns the (day, year) it waited for
+    """
+    (tmp_path / "TEMPLATE_FILE.py").write_text('"""{year} day {day}"""\n')
+    monkeypatch.chdir(tmp_path)
+    waited = []
+    monkeypatch.setattr(
+        main,
+        "wait_and_create_input_files",
+        lambda day, year, save_example_input: waited.append((day, year)),
+    )
+
+    def run(now: dt.datetime, *args: str) -> list:
+        monkeypatch.setattr(main, "eastern_now", lambda: now)
+        monkeypatch.setattr(sys, "argv", ["newday", *args])
+        main.newday()
+        return waited
+
+    return run
+
+
+def test_newday_wait_before_unlock(newday, tmp_path):
+    assert newday(eastern(2024, 12, 5, 23, 30), "-w") == [(6, 2024)]
+    assert (tmp_path / "2024" / "solutions" / "day6.py").exists()
+
+
+def test_newday_wait_on_christmas_night(newday):
+    assert newday(eastern(2024, 12, 25, 23, 30), "-w") == [(25, 2024)]
+
+
+def test_newday_wait_new_years_eve(newday):
+    # same as running without -w, no day 31 puzzle (and never next year)
+    with pytest.raises(ValueError, match="Day needs to be in range"):
+        newday(eastern(2024, 12, 31, 23, 30), "-w")